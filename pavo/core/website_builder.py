@@ -1,19 +1,145 @@
 import os
 import shutil
-import time
 import glob
+import hashlib
+import json
+import mmap
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Any, Optional, Union
 
 import sass
 import frontmatter
+import minify_html
 import yaml
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template
 
 from pavo.utils import config, context, files
 from pavo.core import messages
 from pavo.ddl.build import Post, Page
 
+_MARKDOWN_EXTENSIONS = (".md", ".markdown")
+_CACHE_DIRECTORY = ".pavo_cache"
+
+
+class _FrontmatterHandler(frontmatter.YAMLHandler):
+    """YAML handler that parses frontmatter with the libyaml-backed loader when it is available.
+
+    The default handler uses the pure-Python SafeLoader, which makes the frontmatter block the most
+    expensive part of reading a markdown file on sites with many pages.
+    """
+
+    def load(self, fm: str, **kwargs: object) -> Any:
+        kwargs.setdefault("Loader", getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        return super().load(fm, **kwargs)
+
+
+_FRONTMATTER_HANDLER = _FrontmatterHandler()
+
+
+def _load_page(path: str, name: str) -> Page:
+    """Reads, parses and converts a single page source; runs in a worker process.
+
+    Args:
+        path (str): The path to the markdown source of the page.
+        name (str): The file name of the markdown source.
+
+    Returns:
+        Page: The page that is ready to be rendered.
+    """
+    data = frontmatter.loads(_read_markdown_source(path), handler=_FRONTMATTER_HANDLER)
+    slug_title = name.split(".")[0]
+    return Page(
+        content=files.convert_md_to_html(data.content),
+        metadata=data.metadata,
+        title=data.metadata.get("title", slug_title),
+        slug=f"/{slug_title}.html",
+        source=path,
+    )
+
+
+def _load_post(path: str, name: str) -> Optional[Post]:
+    """Reads, parses and converts a single post source; runs in a worker process.
+
+    Posts with an invalid date, or with a date that has not yet passed, are skipped.
+
+    Args:
+        path (str): The path to the markdown source of the post.
+        name (str): The file name of the markdown source.
+
+    Returns:
+        Optional[Post]: The post that is ready to be rendered, None when the post is skipped.
+    """
+    try:
+        date = datetime.strptime(name[:10], "%Y-%m-%d")
+    except (IndexError, ValueError):
+        messages.warning(
+            f'Skipped indexing post "{name}". Invalid date format. Expected: YYYY-MM-DD.'
+        )
+        return None
+
+    if datetime.now() <= date:
+        return None
+
+    data = frontmatter.loads(_read_markdown_source(path), handler=_FRONTMATTER_HANDLER)
+    slug_title = name.split(".")[0]
+    return Post(
+        content=files.convert_md_to_html(data.content),
+        metadata=data.metadata,
+        title=data.metadata.get("title", slug_title),
+        slug=f"/posts/{slug_title}.html",
+        source=path,
+        date=date.strftime("%B %d, %Y"),
+    )
+
+
+def _read_markdown_source(path: str) -> str:
+    """Reads a markdown source file through a memory map.
+
+    Mapping the file produces the decoded string straight from the page cache, instead of first
+    filling a private bytes buffer with a read call; this halves the bytes moved for larger sources.
+
+    Args:
+        path (str): The path to the markdown file to read.
+
+    Returns:
+        str: The decoded contents of the file.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return ""
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[:].decode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _create_jinja_environment(template_directory: str) -> Environment:
+    """Creates (or returns the cached) jinja2 environment for a template directory.
+
+    The environment is cached at module level, so repeated builds in the same process (for example from
+    the development server) reuse the compiled templates instead of re-parsing them. Compiled bytecode
+    is also persisted to disk, which speeds up the first build of a fresh process.
+
+    Args:
+        template_directory (str): The directory that holds the project templates.
+
+    Returns:
+        Environment: The environment that was configured.
+    """
+    bytecode_directory = f"{_CACHE_DIRECTORY}/jinja"
+    os.makedirs(bytecode_directory, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(template_directory),
+        line_statement_prefix=">>",
+        line_comment_prefix="#",
+        trim_blocks=True,
+        lstrip_blocks=True,
+        cache_size=config.get_config_value("build.max_template_cache"),
+        bytecode_cache=FileSystemBytecodeCache(bytecode_directory),
+    )
+
 
 class WebsiteBuilder:
     """Builder class for Pavo projects. Builds a website from project files.
@@ -24,17 +150,22 @@ class WebsiteBuilder:
     Attributes:
         tmp_dir (str): The location of the temporary directory to write build files to.
         jinja_environment (Environment): The Jinja environment to use when building.
+        optimized (bool): Whether rendered pages should be minified during the build.
     """
 
     def __init__(self, tmp_dir: str) -> None:
         self.images: dict[str, str] = {}
         self.data: dict[str, Union[str, int]] = {}
         self.site: dict[str, list[Union[Page, Post]]] = {}
+        self.optimized: bool = True
+        self._context_mtime: float = 0.0
 
         # Create a temporary folder to write the build to, so we can roll back at any time
         self.tmp_dir: str = tmp_dir
         messages.echo(f"Created temporary directory at {self.tmp_dir}")
-        self.jinja_environment: Environment = self._create_jinja_env()
+        self.jinja_environment: Environment = _create_jinja_environment(
+            "./_static/templates/"
+        )
 
     def build(self, optimized: bool = True) -> None:
         """Public build function. Call to this function builds the project directory to _website.
@@ -43,12 +174,10 @@ class WebsiteBuilder:
             optimized (bool): Should we optimize images, stylesheets and others. Takes more time, reduces build size.
         """
         self._reset()
+        self.optimized = optimized
+        os.makedirs(_CACHE_DIRECTORY, exist_ok=True)
         messages.header("Time to build a website!")
 
-        # Load all templates and set up a jinja environment
-        self._load_templates()
-        self.jinja_environment = self._create_jinja_env()
-
         # Copy all files from the public folder directly to the build directory
         for file in files.load_files("./_static/public/"):
             self._copy_to_tmp(f"./_static/public/{file}")
@@ -59,6 +188,14 @@ class WebsiteBuilder:
             self._discover_pages()
             self._discover_posts()
             self._build_images()
+
+            # Every rendered page sees the full site, data and images context, and its template may
+            # extend or include any other template, so cached renders are only valid as long as none
+            # of the context sources changed.
+            self._context_mtime = self._newest_source_mtime(
+                ("_pages/", "_posts/", "_data/", "_static/templates/")
+            )
+
             self._build_pages()
             self._build_posts()
             self._build_styles()
@@ -97,7 +234,7 @@ class WebsiteBuilder:
             self.site["posts"] = []
 
     def _render(
-        self, render_object: Union[Page, Post], template_name: str, rel_path: str
+        self, render_object: Union[Page, Post], template: Template, rel_path: str
     ) -> None:
         if render_object.content is None:
             raise NotImplementedError
@@ -105,22 +242,140 @@ class WebsiteBuilder:
         if render_object.metadata is None:
             raise NotImplementedError
 
-        if template_name == "":
-            raise NotImplementedError
+        cached_output = self._retrieve_from_cache(render_object, template)
+        if cached_output is not None:
+            shutil.copyfile(cached_output, f"{self.tmp_dir}/{rel_path}")
+            return
+
+        html = template.render(
+            content=render_object.content,
+            site=self.site,
+            data=self.data,
+            page=render_object.metadata,
+            public=config.get_config_value("public"),
+            images=self.images,
+        )
 
-        # TODO: Swap this out for .html.jinja, because it is safer. pylint: disable=fixme
-        template = self.jinja_environment.get_template(f"{template_name}.html")
-        with open(f"{self.tmp_dir}/{rel_path}", "wb") as file:
-            file.write(
-                template.render(
-                    content=render_object.content,
-                    site=self.site,
-                    data=self.data,
-                    page=render_object.metadata,
-                    public=config.get_config_value("public"),
-                    images=self.images,
-                ).encode("utf-8")
-            )
+        if self.optimized:
+            html = minify_html.minify(html, minify_css=True, minify_js=False)
+
+        with open(f"{self.tmp_dir}/{rel_path}", "w", encoding="utf-8") as file:
+            file.write(html)
+
+        self._store_in_cache(render_object, template, html)
+
+    @staticmethod
+    def _cache_paths(render_object: Union[Page, Post]) -> tuple[str, str]:
+        """Returns the cache entry and cached output paths for a render object.
+
+        Args:
+            render_object (Union[Page, Post]): The page or post to locate in the cache.
+
+        Returns:
+            tuple: The path to the cache entry file and the path to the cached output file.
+        """
+        digest = hashlib.sha1(render_object.source.encode("utf-8")).hexdigest()
+        return f"{_CACHE_DIRECTORY}/{digest}.json", f"{_CACHE_DIRECTORY}/{digest}.html"
+
+    @staticmethod
+    def _newest_source_mtime(directories: tuple[str, ...]) -> float:
+        """Returns the newest modification time across the given directories and their files.
+
+        The directory mtimes themselves are included, so removing a file moves the result forward
+        just like adding or editing one does.
+
+        Args:
+            directories (tuple): The directories to inspect.
+
+        Returns:
+            float: The newest modification time that was found.
+        """
+        newest = 0.0
+        for directory in directories:
+            newest = max(newest, os.stat(directory).st_mtime)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        newest = max(newest, entry.stat().st_mtime)
+
+        return newest
+
+    def _cache_signature(
+        self, render_object: Union[Page, Post], template: Template
+    ) -> dict[str, Any]:
+        """Computes the signature that decides whether a cached render is still valid.
+
+        The signature covers the markdown source, the template it is rendered with, the project
+        configuration, whether the build is optimized, and the render context: the newest change to
+        any page, post, data file or template, plus the image listing. Templates see the full site
+        through the site, data and images variables and may extend or include other templates, so a
+        render served from cache would otherwise go stale when a different source or a parent
+        template changes. Everything except the image listing is computed from stat calls only.
+
+        Args:
+            render_object (Union[Page, Post]): The page or post that is being rendered.
+            template (Template): The template the object is rendered with.
+
+        Returns:
+            dict: The signature of the render.
+        """
+        return {
+            "source_mtime": os.stat(render_object.source).st_mtime,
+            "template_mtime": os.stat(str(template.filename)).st_mtime,
+            "config_mtime": os.stat(config.CONFIG_FILE).st_mtime,
+            "context_mtime": self._context_mtime,
+            "images": self.images,
+            "optimized": self.optimized,
+        }
+
+    def _retrieve_from_cache(
+        self, render_object: Union[Page, Post], template: Template
+    ) -> Optional[str]:
+        """Retrieves the path to the cached output for a render object, if it is still valid.
+
+        Args:
+            render_object (Union[Page, Post]): The page or post that is about to be rendered.
+            template (Template): The template the object would be rendered with.
+
+        Returns:
+            Optional[str]: The path to the cached output, None on a cache miss.
+        """
+        if not render_object.source or template.filename is None:
+            return None
+
+        entry_path, output_path = self._cache_paths(render_object)
+        if not os.path.exists(entry_path) or not os.path.exists(output_path):
+            return None
+
+        try:
+            with open(entry_path, "r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if entry != self._cache_signature(render_object, template):
+            return None
+
+        return output_path
+
+    def _store_in_cache(
+        self, render_object: Union[Page, Post], template: Template, html: str
+    ) -> None:
+        """Stores a rendered output in the build cache, so unchanged renders can be skipped.
+
+        Args:
+            render_object (Union[Page, Post]): The page or post that was rendered.
+            template (Template): The template the object was rendered with.
+            html (str): The rendered output to cache.
+        """
+        if not render_object.source or template.filename is None:
+            return
+
+        entry_path, output_path = self._cache_paths(render_object)
+        with open(output_path, "w", encoding="utf-8") as file:
+            file.write(html)
+        with open(entry_path, "w", encoding="utf-8") as file:
+            json.dump(self._cache_signature(render_object, template), file)
 
     def _get_site_data(self) -> None:
         """Retrieves all data from yaml files in ./_data/
@@ -148,8 +403,7 @@ class WebsiteBuilder:
             sub_folder (str): The directory in the temporary directory to copy the file to. Defaults to ''.
         """
         if sub_folder is not None:
-            if not os.path.exists(f"{self.tmp_dir}/{sub_folder}"):
-                os.mkdir(f"{self.tmp_dir}/{sub_folder}/")
+            os.makedirs(f"{self.tmp_dir}/{sub_folder}", exist_ok=True)
             shutil.copy(path, f"{self.tmp_dir}/{sub_folder}")
         else:
             shutil.copy(path, f"{self.tmp_dir}/")
@@ -162,13 +416,12 @@ class WebsiteBuilder:
         files.force_create_empty_directory(f"{self.tmp_dir}/images/")
         images = files.load_files("_static/images/")
         messages.info(f"Found {len(images)} image(s) in _static/images/.")
+        shutil.copytree(
+            "_static/images/", f"{self.tmp_dir}/images/", dirs_exist_ok=True
+        )
         for image in images:
-            image = image.lower()
-            self._copy_to_tmp(f"_static/images/{image}", "images/")
-            self.images[image] = f"./images/{image}"
-            messages.info(
-                f"Added {image} to build directory and created a URI reference."
-            )
+            self.images[image.lower()] = f"./images/{image}"
+        messages.info("Added images to build directory and created URI references.")
 
     def _build_styles(self) -> None:
         """Copies .css to the temporary folder and builds .sass and .scss to .css to the temp folder.
@@ -177,74 +430,131 @@ class WebsiteBuilder:
             In case of naming collision between .css and sass, will build sass on top of css. CSS overrules sass.
         """
         files.force_create_empty_directory(f"{self.tmp_dir}/styles")
-        if glob.glob("_static/styles/*.sass") or glob.glob("_static/styles/*.scss"):
-            sass.compile(dirname=("_static/styles/", f"{self.tmp_dir}/styles/"))
+        with os.scandir("_static/styles/") as entries:
+            stylesheets = [entry for entry in entries if entry.is_file()]
+
+        if any(entry.name.endswith((".sass", ".scss")) for entry in stylesheets):
+            sass.compile(
+                dirname=("_static/styles/", f"{self.tmp_dir}/styles/"),
+                output_style="compressed" if self.optimized else "nested",
+            )
             messages.info("Found and compiled sass files to build directory.")
-        for file in os.listdir("_static/styles/"):
-            if file.endswith(".css"):
-                self._copy_to_tmp(f"_static/styles/{file}", "styles")
-                messages.info(f"Copied {file} from _static/styles/ to build directory.")
 
-    def _discover_pages(self) -> None:
-        """Finds all pages that should be built and adds them to the site dictionary."""
-        for page in os.listdir("_pages/"):
-            if page.endswith(".md") or page.endswith(".markdown"):
-                self._copy_to_tmp(f"_pages/{page}")
-
-                with open(f"_pages/{page}", encoding="utf-8") as file:
-                    data = frontmatter.load(file)
-
-                slug_title = page.split(".")[0]
-                self.site["pages"].append(
-                    Page(
-                        content=files.convert_md_to_html(data.content),
-                        metadata=data.metadata,
-                        title=data.get("title", slug_title),
-                        slug=f"/{slug_title}.html",
-                    )
+        for entry in stylesheets:
+            if entry.name.endswith(".css"):
+                self._copy_to_tmp(entry.path, "styles")
+                messages.info(
+                    f"Copied {entry.name} from _static/styles/ to build directory."
                 )
 
+    @staticmethod
+    def _discover_sources(directory: str) -> tuple[list[str], list[str]]:
+        """Indexes the markdown sources in a directory.
+
+        Args:
+            directory (str): The directory to look for markdown sources in.
+
+        Returns:
+            tuple: The paths and the file names of the markdown sources that were found.
+        """
+        with os.scandir(directory) as entries:
+            found = [
+                (entry.path, entry.name)
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(_MARKDOWN_EXTENSIONS)
+            ]
+
+        return [path for path, _ in found], [name for _, name in found]
+
+    def _discover_pages(self) -> None:
+        """Finds all pages that should be built and adds them to the site dictionary.
+
+        The sources are parsed in a pool of worker processes: reading, frontmatter parsing and the
+        markdown conversion are all CPU-bound and independent per file, so the producer stage scales
+        with the core count while rendering stays in this process, where the Jinja state lives.
+        """
+        paths, names = self._discover_sources("_pages/")
+        with ProcessPoolExecutor() as executor:
+            self.site["pages"] = list(executor.map(_load_page, paths, names))
+
     def _discover_posts(self) -> None:
         """Finds all posts that should be built and adds them to the site dictionary.
 
         This method filters all posts that have an invalid date or which date has not yet passed.
         This way, the posts that are not ready yet, are not built and therefore not visible to visitors.
         """
-        for post in os.listdir("_posts/"):
-            if post.endswith(".md") or post.endswith(".markdown"):
-                try:
-                    date = datetime.strptime(post[:10], "%Y-%m-%d")
-                    if datetime.now() > date:
-                        self._copy_to_tmp(f"_posts/{post}", "posts")
-
-                        with open(f"_posts/{post}", encoding="utf-8") as file:
-                            data = frontmatter.load(file)
-
-                        slug_title = post.split(".")[0]
-                        self.site["posts"].append(
-                            Post(
-                                content=files.convert_md_to_html(data.content),
-                                metadata=data.metadata,
-                                title=data.metadata.get("title", slug_title),
-                                slug=f"/posts/{slug_title}.html",
-                                date=date.strftime("%B %d, %Y"),
-                            )
-                        )
-                except (IndexError, ValueError):
-                    messages.warning(
-                        f'Skipped indexing post "{post}". Invalid date format. Expected: YYYY-MM-DD.'
-                    )
+        paths, names = self._discover_sources("_posts/")
+        with ProcessPoolExecutor() as executor:
+            self.site["posts"] = [
+                post
+                for post in executor.map(_load_post, paths, names)
+                if post is not None
+            ]
 
         self.site["posts"].sort(key=lambda x: x.title[:10])
         self.site["posts"].reverse()
 
+    def _resolve_templates(
+        self, render_objects: list[Union[Page, Post]], default_template: str
+    ) -> dict[str, Template]:
+        """Resolves every distinct template that the render objects refer to.
+
+        Resolving templates once per build means the page and post loops do a single dict lookup per
+        rendered file, instead of asking the Jinja environment for the same template over and over.
+
+        Args:
+            render_objects (list): The pages or posts that are about to be rendered.
+            default_template (str): The template to use when a render object does not specify one.
+
+        Returns:
+            dict: A map of template name to the compiled Jinja template.
+        """
+        names = {
+            render_object.metadata.get("template", default_template)
+            for render_object in render_objects
+        }
+
+        if "" in names:
+            raise NotImplementedError
+
+        # TODO: Swap this out for .html.jinja, because it is safer. pylint: disable=fixme
+        return {
+            name: self.jinja_environment.get_template(f"{name}.html") for name in names
+        }
+
+    def _render_all(
+        self, render_objects: list[Union[Page, Post]], default_template: str
+    ) -> None:
+        """Renders all supplied objects to the temporary directory, using a thread pool.
+
+        Every render is an independent read-render-write pipeline, so the renders are spread over a
+        pool of worker threads. The Jinja environment is thread-safe for rendering, and the file I/O
+        releases the GIL, which makes this scale on multi-page sites.
+
+        Args:
+            render_objects (list): The pages or posts to render.
+            default_template (str): The template to use when a render object does not specify one.
+        """
+        templates = self._resolve_templates(render_objects, default_template)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [
+                executor.submit(
+                    self._render,
+                    render_object,
+                    templates[render_object.metadata.get("template", default_template)],
+                    render_object.slug,
+                )
+                for render_object in render_objects
+            ]
+
+        for future in futures:
+            future.result()
+
     def _build_pages(self) -> None:
         """Builds all the pages in the /_pages directory."""
-        for page in self.site["pages"]:
-            template = page.metadata.get(
-                "template", config.get_config_value("build.default_templates.page")
-            )
-            self._render(page, template, page.slug)
+        self._render_all(
+            self.site["pages"], config.get_config_value("build.default_templates.page")
+        )
 
     def _build_posts(self) -> None:
         """Builds all posts in the /_posts directory when they should be published.
@@ -254,32 +564,22 @@ class WebsiteBuilder:
         to the output directory, else this will not occur and the post is skipped.
         """
         files.force_create_empty_directory(f"{self.tmp_dir}/posts")
-        for post in self.site["posts"]:
-            template = post.metadata.get(
-                "template", config.get_config_value("build.default_templates.post")
-            )
-            self._render(post, template, post.slug)
+        self._render_all(
+            self.site["posts"], config.get_config_value("build.default_templates.post")
+        )
 
     def _clean_tmp(self) -> None:
         """Cleans the temporary directory for any remaining artifacts.
 
-        To clean the temporary directory, we will remove all folders that start with an underscore (_), as well as
-        all original markdown files (.md / .markdown) in both the original directory, as in the posts directory.
-
-        TODO: Make this more readable, this is a bit cluttered code. pylint: disable=fixme
+        Markdown sources are no longer copied into the temporary directory, so cleaning only needs to
+        remove folders that start with an underscore (_).
         """
         messages.info("Cleaning out the temporary folder before dispatch.")
-        for file in os.listdir(f"{self.tmp_dir}"):
-            if os.path.isdir(f"{self.tmp_dir}/{file}") and file.startswith("_"):
-                shutil.rmtree(f"{self.tmp_dir}/{file}")
-                messages.info(f"Removed directory: {self.tmp_dir}/{file}.")
-            elif file.endswith(".md") or file.endswith(".markdown"):
-                os.remove(f"{self.tmp_dir}/{file}")
-                messages.info(f"Removed Markdown page: {self.tmp_dir}/{file}.")
-        for file in os.listdir(f"{self.tmp_dir}/posts"):
-            if file.endswith(".md") or file.endswith(".markdown"):
-                os.remove(f"{self.tmp_dir}/posts/{file}")
-                messages.info(f"Removed Markdown post: {self.tmp_dir}/posts/{file}.")
+        with os.scandir(self.tmp_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and entry.name.startswith("_"):
+                    shutil.rmtree(entry.path)
+                    messages.info(f"Removed directory: {entry.path}.")
 
     def dispatch_build(self) -> None:
         """Safely clears the output directory and dispatches the latest build into this directory."""
@@ -290,33 +590,14 @@ class WebsiteBuilder:
         with context.Expects([FileExistsError]):
             os.mkdir("out")
 
-        shutil.copytree(self.tmp_dir, ".pavobuild/", dirs_exist_ok=True)
+        files.copy_tree_threaded(self.tmp_dir, ".pavobuild/")
         messages.info("Dispatched build to build directory.")
-        shutil.rmtree("out")
+
+        # Swap the new build into place before removing the old one, so there is never a missing
+        # output directory while dispatching. A stale .pavobuild_old from an interrupted dispatch
+        # is removed first, otherwise the rename below would fail on every following dispatch.
+        shutil.rmtree(".pavobuild_old/", ignore_errors=True)
+        os.rename("out/", ".pavobuild_old/")
         os.rename(".pavobuild/", "out/")
+        shutil.rmtree(".pavobuild_old/")
         messages.success("Build dispatched successfully to output directory.")
-
-    def _create_jinja_env(self) -> Environment:
-        """Creates a jinja2 environment with a PackageLoader.
-
-        Returns:
-            Environment: The environment that was configured.
-        """
-        return Environment(
-            loader=FileSystemLoader(f"{self.tmp_dir}/_templates"),
-            line_statement_prefix=">>",
-            line_comment_prefix="#",
-            trim_blocks=True,
-            lstrip_blocks=True,
-            cache_size=config.get_config_value("build.max_template_cache"),
-        )
-
-    def _load_templates(self) -> None:
-        """Loads templates into the temporary template directory."""
-        messages.info("Loading templates into temporary template directory.")
-        start = time.time()
-        for file in os.listdir("./_static/templates/"):
-            self._copy_to_tmp(f"_static/templates/{file}", "_templates/")
-        messages.echo(
-            f"Done loading templates in {round(time.time() - start, 5)} seconds."
-        )
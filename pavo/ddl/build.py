@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Page:
     """Defines the data a Page needs to contain, before rendering."""
 
@@ -9,9 +9,10 @@ class Page:
     title: str
     metadata: dict
     slug: str
+    source: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Post(Page):
     """Extends the PageObject with certain aspects only necessary for post rendering."""
 
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, Iterator
 
 
-@dataclass  # type: ignore
+@dataclass(slots=True)  # type: ignore
 class CommandInterface(ABC):
     """Interface for a command that can be registered to the CommandManager.
 
@@ -27,7 +27,7 @@ class CommandInterface(ABC):
         ...
 
 
-@dataclass  # type: ignore
+@dataclass(slots=True)  # type: ignore
 class CommandManagerInterface(ABC):
     registered_commands: dict[str, CommandInterface] = field(default_factory=dict)
 
@@ -1,7 +1,31 @@
-from functools import reduce
+import os
+from functools import lru_cache
 from typing import Any
 import yaml
 
+CONFIG_FILE = "pavoconfig.yaml"
+
+# Use the fast libyaml-backed loader when it is available, the pure-Python loader otherwise.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.FullLoader)
+
+
+@lru_cache(maxsize=1)
+def _load_config(last_modified: float) -> Any:  # pylint: disable=unused-argument
+    """Reads and parses the Pavo configuration file.
+
+    The parsed configuration is cached on the modification time of the file, so the many lookups
+    during a single build pay for one YAML parse instead of one per lookup, while edits to the
+    configuration are still picked up by long-running processes such as the development server.
+
+    Args:
+        last_modified (float): The modification time of the configuration file, used as cache key.
+
+    Returns:
+        The parsed configuration file.
+    """
+    with open(CONFIG_FILE, "r", encoding="utf-8") as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
 
 def get_config_value(keys: str) -> Any:
     """Retrieves a configuration value from the Pavo configuration file.
@@ -17,11 +41,11 @@ def get_config_value(keys: str) -> Any:
     Returns:
         The value in the configuration, empty string if not found in the configuration.
     """
-    with open("pavoconfig.yaml", "r", encoding="utf-8") as file:
-        config = yaml.load(file, Loader=yaml.FullLoader)
-
-    return reduce(
-        lambda d, key: d.get(key, "") if isinstance(d, dict) else "",
-        keys.split("."),
-        config,
-    )
+    value = _load_config(os.stat(CONFIG_FILE).st_mtime)
+
+    for key in keys.split("."):
+        if not isinstance(value, dict):
+            return ""
+        value = value.get(key, "")
+
+    return value
@@ -1,8 +1,11 @@
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import markdown2
 
-from ._config import get_config_value
+from . import _config
 
 
 def set_dir(directory: str) -> bool:
@@ -38,6 +41,36 @@ def force_create_empty_directory(directory: str) -> None:
         os.mkdir(directory)
 
 
+def copy_tree_threaded(source: str, destination: str) -> None:
+    """Recursively copies a directory tree, spreading the file copies over a thread pool.
+
+    The directory structure is created up front, after which the individual file copies are handed to
+    a pool of worker threads. The copies release the GIL, which makes this noticeably faster than a
+    serial shutil.copytree on directories with many files.
+
+    Args:
+        source (str): The path to the directory that should be copied.
+        destination (str): The path to copy the directory to.
+    """
+    pairs = []
+    for root, _, filenames in os.walk(source):
+        target_root = os.path.join(destination, os.path.relpath(root, source))
+        os.makedirs(target_root, exist_ok=True)
+        for filename in filenames:
+            pairs.append(
+                (os.path.join(root, filename), os.path.join(target_root, filename))
+            )
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(shutil.copy2, source_file, target_file)
+            for source_file, target_file in pairs
+        ]
+
+    for future in futures:
+        future.result()
+
+
 def cd_is_project() -> bool:
     """Checks whether the current directory is a Pavo project.
 
@@ -63,6 +96,22 @@ def load_files(path: str) -> dict[str, str]:
     return files
 
 
+@lru_cache(maxsize=None)
+def _markdown_converter(extras: tuple) -> markdown2.Markdown:
+    """Creates (or returns the cached) markdown2 converter for a set of extras.
+
+    Reusing a converter means markdown2 compiles its internal regexes once per set of extras,
+    instead of once for every converted file.
+
+    Args:
+        extras (tuple): The markdown2 extras to configure the converter with.
+
+    Returns:
+        markdown2.Markdown: The converter that was configured.
+    """
+    return markdown2.Markdown(extras=list(extras) or None)
+
+
 def convert_md_to_html(markdown: str) -> str:
     """Translates raw markdown into ready html code.
 
@@ -75,9 +124,9 @@ def convert_md_to_html(markdown: str) -> str:
     Returns:
         str: The html that was built from the markdown.
     """
-    html = markdown2.markdown(
-        markdown, extras=get_config_value("build.markdown.extras")
-    )
+    extras = _config.get_config_value("build.markdown.extras")
+    converter = _markdown_converter(tuple(extras) if extras else ())
+    html = converter.convert(markdown)
     html = html.replace("\n\n", "\n").rstrip()
 
     return str(html)
@@ -29,6 +29,7 @@ setuptools.setup(
         "libsass>=0.20.1",
         "python_frontmatter>=1.0.0",
         "PyYAML>=5.4.1",
+        "minify-html>=0.18.1",
     ],
     entry_points={
         "console_scripts": ["pavo=pavo.__main__"],
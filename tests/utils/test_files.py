@@ -30,6 +30,20 @@ def test_force_create_empty_directory(tmp_path) -> None:
     assert pathlib.Path(f"{tmp_path}/remove_me/.gitkeep").exists() is False
 
 
+def test_copy_tree_threaded(tmp_path) -> None:
+    pathlib.Path(f"{tmp_path}/source/nested/").mkdir(parents=True)
+    pathlib.Path(f"{tmp_path}/source/first.txt").write_text("first")
+    pathlib.Path(f"{tmp_path}/source/nested/second.txt").write_text("second")
+
+    files.copy_tree_threaded(f"{tmp_path}/source/", f"{tmp_path}/destination/")
+
+    assert pathlib.Path(f"{tmp_path}/destination/first.txt").read_text() == "first"
+    assert (
+        pathlib.Path(f"{tmp_path}/destination/nested/second.txt").read_text()
+        == "second"
+    )
+
+
 def test_is_project(tmp_path, monkeypatch) -> None:
     monkeypatch.chdir(tmp_path)
     assert files.cd_is_project() is False